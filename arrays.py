@@ -72,10 +72,11 @@ class DynamicArray:
         self.__length += 1
 
     def remove_at(self, index):
-        if index > self.__length:
+        if not 0 <= index < self.__length:
             raise IndexError("Out of bounds")
         data = self.__array[index]
-        self.__array = [self.__array[idx] for idx in range(self.__capacity) if idx != index]
+        # pad the end so the backing array keeps its capacity
+        self.__array = [elem for idx, elem in enumerate(self.__array) if idx != index] + [None]
         self.__length -= 1
         return data
 
@@ -96,3 +97,14 @@ if __name__ == "__main__":
 
     print(numbers.remove(15))
     print(f"Numbers: {numbers} with length: {len(numbers)}")
+
+    # repeated removals keep the backing array at capacity
+    numbers.remove_at(0)
+    numbers.remove_at(0)
+    print(f"Numbers: {numbers} with length: {len(numbers)}")
+
+    # removing one past the end is out of bounds rather than dropping an element
+    try:
+        numbers.remove_at(len(numbers))
+    except IndexError as e:
+        print(f"remove_at({len(numbers)}): {e}")
@@ -0,0 +1,25 @@
+"""
+Benchmark suite for the data structures in this repository.
+
+Times the core operations of DynamicArray, DoublyLinkedList, Stack, Queue and
+PriorityQueue at several input sizes, measures peak memory, and runs the same
+workloads against the stdlib equivalents (list, collections.deque, heapq).
+
+Usage (from the repository root):
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output current.json
+    python -m benchmarks compare baseline.json current.json
+
+`compare` gates on each structure's time relative to its stdlib reference, timed
+alongside it in the same run, which cancels out noise from the machine itself
+(--absolute compares raw times instead). The threshold is widened by the noise
+measured in each row. It exits with status 1 when any benchmark regressed past
+the threshold or a baseline benchmark is missing from the current run
+(--allow-missing to skip). Stdlib rows are reported but only gated with
+--gate-stdlib.
+"""
+from benchmarks.cases import CASES, Case
+from benchmarks.runner import compare, load, run, save
+
+__all__ = ["CASES", "Case", "compare", "load", "run", "save"]
@@ -0,0 +1,83 @@
+import argparse
+import sys
+
+from benchmarks.cases import CASES
+from benchmarks.runner import (
+    DEFAULT_REPEAT,
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_comparison,
+    format_report,
+    load,
+    run,
+    save,
+)
+
+
+def _run(args: argparse.Namespace) -> int:
+    cases = CASES
+    if args.filter:
+        cases = [c for c in CASES if any(f in c.name for f in args.filter)]
+    report = run(sizes=args.sizes, repeat=args.repeat, cases=cases)
+    print(format_report(report))
+    if args.output:
+        save(report, args.output)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    comparison = compare(
+        load(args.baseline),
+        load(args.current),
+        args.threshold,
+        check_memory=not args.time_only,
+        relative=not args.absolute,
+        gate_stdlib=args.gate_stdlib,
+    )
+    print(format_comparison(comparison))
+    failed = False
+    regressions = [r for r in comparison["rows"] if r["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        failed = True
+    if comparison["missing"] and not args.allow_missing:
+        print(f"\n{len(comparison['missing'])} benchmark(s) in the baseline are missing from the current run")
+        failed = True
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Data structure benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--filter", nargs="+", help="only run benchmarks whose name contains one of these")
+    run_parser.add_argument("--output", help="path of the JSON file to write results to")
+    run_parser.set_defaults(func=_run)
+
+    compare_parser = sub.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--time-only", action="store_true", help="ignore peak memory changes")
+    compare_parser.add_argument(
+        "--absolute",
+        action="store_true",
+        help="compare raw times instead of each structure's ratio to its stdlib reference",
+    )
+    compare_parser.add_argument("--gate-stdlib", action="store_true", help="also fail on regressions in stdlib rows")
+    compare_parser.add_argument(
+        "--allow-missing", action="store_true", help="don't fail when baseline benchmarks are missing from the current run"
+    )
+    compare_parser.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Benchmark cases for each data structure and its stdlib equivalent.
+
+Every case has a setup step (untimed) that builds the structure at size n and a
+run step (timed) that performs a batch of operations on it. Operations that are
+O(1) or O(log(n)) are run n times; operations that are O(n) per call are run a
+fixed BATCH times so the larger sizes finish in reasonable time.
+"""
+import heapq
+import random
+from collections import deque
+from typing import Any, Callable, List, Optional
+
+from arrays import DynamicArray
+from lists import DoublyLinkedList
+from priority_queues import PriorityQueue
+from queues import Queue
+from stacks import Stack
+
+# number of operations for cases that are linear per call
+BATCH = 100
+
+# fixed seed so every run shuffles the same way
+SEED = 1234
+
+
+class Case:
+    """
+    A single benchmark: `setup(n)` returns the state handed to `run(state, n)`.
+    `ops(n)` is the number of operations `run` performs, used for per-op timings.
+    `reference` names the stdlib case this one should be compared against.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[int], Any],
+        run: Callable[[Any, int], None],
+        ops: Callable[[int], int] = lambda n: n,
+        reference: Optional[str] = None,
+    ):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.ops = ops
+        self.reference = reference
+
+    def __str__(self):
+        return self.name
+
+
+def _batch(n: int) -> int:
+    return min(n, BATCH)
+
+
+def _shuffled(n: int) -> List[int]:
+    values = list(range(n))
+    random.Random(SEED).shuffle(values)
+    return values
+
+
+# region builders
+def _dynamic_array(n: int) -> DynamicArray:
+    arr = DynamicArray()
+    for i in range(n):
+        arr.add(i)
+    return arr
+
+
+def _linked_list(n: int) -> DoublyLinkedList:
+    dll = DoublyLinkedList()
+    for i in range(n):
+        dll.append(i)
+    return dll
+
+
+def _stack(n: int) -> Stack:
+    stack = Stack()
+    for i in range(n):
+        stack.push(i)
+    return stack
+
+
+def _queue(n: int) -> Queue:
+    queue = Queue()
+    for i in range(n):
+        queue.enqueue(i)
+    return queue
+
+
+def _priority_queue(n: int) -> PriorityQueue:
+    pq = PriorityQueue()
+    for value in _shuffled(n):
+        pq.add(value)
+    return pq
+
+
+def _heap(n: int) -> List[int]:
+    heap = _shuffled(n)
+    heapq.heapify(heap)
+    return heap
+
+
+# endregion
+
+# region operations
+def _add_all(add: Callable[[int], None], n: int):
+    for i in range(n):
+        add(i)
+
+
+def _push_all(add: Callable[[int], None], values: List[int]):
+    # heaps are fed shuffled values so adds actually have to swim
+    for value in values:
+        add(value)
+
+
+def _remove_middle(remove: Callable[[int], Any], state: Any, n: int):
+    # removing from the middle is the average case for index based removal
+    for _ in range(_batch(n)):
+        remove(len(state) // 2)
+
+
+def _insert_middle(insert: Callable[[int, int], Any], state: Any, n: int):
+    for i in range(_batch(n)):
+        insert(len(state) // 2, i)
+
+
+def _drain(take: Callable[[], Any], n: int):
+    for _ in range(n):
+        take()
+
+
+def _pq_remove(state: PriorityQueue, n: int):
+    for value in _shuffled(n)[: _batch(n)]:
+        state.remove(value)
+
+
+def _heap_remove(state: List[int], n: int):
+    # the stdlib has no keyed removal so use the usual remove + re-heapify
+    for value in _shuffled(n)[: _batch(n)]:
+        state.remove(value)
+        heapq.heapify(state)
+
+
+# endregion
+
+CASES: List[Case] = [
+    # arrays
+    Case("DynamicArray.add", lambda n: DynamicArray(), lambda s, n: _add_all(s.add, n), reference="list.append"),
+    Case(
+        "DynamicArray.remove_at",
+        _dynamic_array,
+        lambda s, n: _remove_middle(s.remove_at, s, n),
+        ops=_batch,
+        reference="list.pop(i)",
+    ),
+    # linked lists
+    Case("DoublyLinkedList.append", lambda n: DoublyLinkedList(), lambda s, n: _add_all(s.append, n), reference="deque.append"),
+    Case(
+        "DoublyLinkedList.remove",
+        _linked_list,
+        lambda s, n: _remove_middle(s.remove, s, n),
+        ops=_batch,
+        reference="deque.del(i)",
+    ),
+    Case(
+        "DoublyLinkedList.insert_at",
+        _linked_list,
+        lambda s, n: _insert_middle(s.insert_at, s, n),
+        ops=_batch,
+        reference="deque.insert(i)",
+    ),
+    # stacks
+    Case("Stack.push", lambda n: Stack(), lambda s, n: _add_all(s.push, n), reference="list.append"),
+    Case("Stack.pop", _stack, lambda s, n: _drain(s.pop, n), reference="list.pop"),
+    # queues
+    Case("Queue.enqueue", lambda n: Queue(), lambda s, n: _add_all(s.enqueue, n), reference="deque.append"),
+    Case("Queue.dequeue", _queue, lambda s, n: _drain(s.dequeue, n), reference="deque.popleft"),
+    # priority queues
+    Case("PriorityQueue.add", lambda n: (PriorityQueue(), _shuffled(n)), lambda s, n: _push_all(s[0].add, s[1]), reference="heapq.heappush"),
+    Case("PriorityQueue.poll", _priority_queue, lambda s, n: _drain(s.poll, n), reference="heapq.heappop"),
+    Case("PriorityQueue.remove", _priority_queue, _pq_remove, ops=_batch, reference="heapq.remove"),
+    # stdlib equivalents
+    Case("list.append", lambda n: [], lambda s, n: _add_all(s.append, n)),
+    Case("list.pop(i)", lambda n: list(range(n)), lambda s, n: _remove_middle(s.pop, s, n), ops=_batch),
+    Case("list.pop", lambda n: list(range(n)), lambda s, n: _drain(s.pop, n)),
+    Case("deque.append", lambda n: deque(), lambda s, n: _add_all(s.append, n)),
+    Case("deque.del(i)", lambda n: deque(range(n)), lambda s, n: _remove_middle(s.__delitem__, s, n), ops=_batch),
+    Case("deque.insert(i)", lambda n: deque(range(n)), lambda s, n: _insert_middle(s.insert, s, n), ops=_batch),
+    Case("deque.popleft", lambda n: deque(range(n)), lambda s, n: _drain(s.popleft, n)),
+    Case("heapq.heappush", lambda n: ([], _shuffled(n)), lambda s, n: _push_all(lambda v: heapq.heappush(s[0], v), s[1])),
+    Case("heapq.heappop", _heap, lambda s, n: _drain(lambda: heapq.heappop(s), n)),
+    Case("heapq.remove", _heap, _heap_remove, ops=_batch),
+]
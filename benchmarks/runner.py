@@ -0,0 +1,252 @@
+"""
+Timing, memory measurement and regression comparison for the benchmark cases.
+
+Each timed sample loops the case until it takes at least MIN_SAMPLE_TIME (the
+same approach as `timeit.Timer.autorange`) with the garbage collector disabled,
+and the best and median of `repeat` samples are reported. Cases with a stdlib
+reference are sampled alternately with it to get a noise resistant ratio, which
+is what regressions are gated on by default. Peak memory is measured in a
+separate, untimed pass with `tracemalloc` since tracing slows allocation down
+considerably.
+"""
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from benchmarks.cases import CASES, Case
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.10
+# minimum duration of each timed sample, in seconds
+MIN_SAMPLE_TIME = 0.02
+
+
+def _sample(case: Case, size: int, loops: int) -> float:
+    # total time of `loops` runs, each on freshly set up (untimed) state
+    total = 0.0
+    for _ in range(loops):
+        state = case.setup(size)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            case.run(state, size)
+            total += time.perf_counter() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return total
+
+
+def _autorange(case: Case, size: int) -> int:
+    # same idea as timeit.Timer.autorange: grow the loop count 1, 2, 5, 10, 20, ...
+    # until a sample takes at least MIN_SAMPLE_TIME so timer resolution and
+    # scheduling jitter don't dominate the fast cases
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            if _sample(case, size, loops * multiplier) >= MIN_SAMPLE_TIME:
+                return loops * multiplier
+        loops *= 10
+
+
+def _spread(values: List[float]) -> float:
+    # half the range relative to the median, used as the noise floor for a row
+    median = statistics.median(values)
+    return (max(values) - min(values)) / (2 * median) if median else 0.0
+
+
+def time_case(case: Case, size: int, repeat: int = DEFAULT_REPEAT, reference: Optional[Case] = None) -> Dict[str, Any]:
+    """
+    Times a single run of `case` over `repeat` samples, reporting the min and median.
+    When a `reference` case is given its samples are interleaved with the case's so
+    both see the same machine conditions, and the median of the paired ratios is
+    reported as `ref_ratio`. The spread of the samples (and of the ratios) is kept
+    as `noise` (and `ref_noise`).
+    """
+    loops = _autorange(case, size)
+    ref_loops = _autorange(reference, size) if reference is not None else 0
+    samples, ratios = [], []
+    for _ in range(repeat):
+        sample = _sample(case, size, loops) / loops
+        samples.append(sample)
+        if reference is not None:
+            ref_sample = _sample(reference, size, ref_loops) / ref_loops
+            ratios.append(sample / ref_sample if ref_sample else 0.0)
+    return {
+        "seconds": min(samples),
+        "median_seconds": statistics.median(samples),
+        "noise": _spread(samples),
+        "ref_ratio": statistics.median(ratios) if ratios else None,
+        "ref_noise": _spread(ratios) if ratios else None,
+    }
+
+
+def peak_memory(case: Case, size: int) -> int:
+    # peak bytes allocated while building the structure and running the operations
+    gc.collect()
+    tracemalloc.start()
+    try:
+        state = case.setup(size)
+        case.run(state, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    cases: Optional[List[Case]] = None,
+) -> Dict[str, Any]:
+    cases = cases if cases is not None else CASES
+    # references are looked up in the full list so a filtered run still pairs with them
+    by_name = {case.name: case for case in CASES}
+    results = []
+    for case in cases:
+        for size in sizes:
+            timing = time_case(case, size, repeat, by_name.get(case.reference))
+            ops = case.ops(size)
+            results.append(
+                {
+                    "name": case.name,
+                    "size": size,
+                    "ops": ops,
+                    "seconds": timing["seconds"],
+                    "median_seconds": timing["median_seconds"],
+                    "noise": timing["noise"],
+                    "ref_ratio": timing["ref_ratio"],
+                    "ref_noise": timing["ref_noise"],
+                    "ns_per_op": timing["seconds"] / ops * 1e9 if ops else 0.0,
+                    "peak_bytes": peak_memory(case, size),
+                    "reference": case.reference,
+                }
+            )
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def save(report: Dict[str, Any], path: str):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _keyed(report: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+    return {(r["name"], r["size"]): r for r in report["results"]}
+
+
+def _ratio(b: Dict[str, Any], c: Dict[str, Any], field: str) -> float:
+    return c[field] / b[field] if b.get(field) and c.get(field) is not None else 1.0
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    check_memory: bool = True,
+    relative: bool = True,
+    gate_stdlib: bool = False,
+) -> Dict[str, Any]:
+    """
+    Compare two reports. A row is a regression when time or peak memory grew by more
+    than `threshold` (0.1 = 10%). The time threshold is widened by the noise measured
+    in either run so a noisy row has to move further before it is flagged.
+
+    By default each structure's time is its ratio to its stdlib reference case, timed
+    in interleaved samples during the same run, which cancels out machine wide noise.
+    With `relative=False` raw times are compared instead, and both the min and the
+    median have to regress. Stdlib rows only count as regressions when `gate_stdlib`
+    is set.
+
+    Returns the compared rows along with the (name, size) keys that are `missing` from
+    the current report and `extra` ones that are not in the baseline.
+    """
+    base, curr = _keyed(baseline), _keyed(current)
+    rows = []
+    for key in sorted(base.keys() & curr.keys()):
+        b, c = base[key], curr[key]
+        # ref_ratio is missing for stdlib rows and older reports, so fall back to raw times
+        is_relative = relative and bool(b.get("ref_ratio")) and c.get("ref_ratio") is not None
+        if is_relative:
+            time_ratio = _ratio(b, c, "ref_ratio")
+            noise = max(b.get("ref_noise") or 0.0, c.get("ref_noise") or 0.0)
+            time_regressed = time_ratio > 1 + threshold + noise
+        else:
+            time_ratio = _ratio(b, c, "ns_per_op")
+            median_ratio = _ratio(b, c, "median_seconds")
+            noise = max(b.get("noise", 0.0), c.get("noise", 0.0))
+            time_regressed = min(time_ratio, median_ratio) > 1 + threshold + noise
+        memory_ratio = _ratio(b, c, "peak_bytes")
+
+        gated = c["reference"] is not None or gate_stdlib
+        regressed = gated and (time_regressed or (check_memory and memory_ratio > 1 + threshold))
+        rows.append(
+            {
+                "name": key[0],
+                "size": key[1],
+                "time_ratio": time_ratio,
+                "memory_ratio": memory_ratio,
+                "noise": noise,
+                "relative": is_relative,
+                "gated": gated,
+                "regression": regressed,
+            }
+        )
+    return {
+        "rows": rows,
+        "missing": sorted(base.keys() - curr.keys()),
+        "extra": sorted(curr.keys() - base.keys()),
+    }
+
+
+# region formatting
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<30}{'size':>8}{'ns/op':>14}{'peak KiB':>12}{'vs stdlib':>12}"]
+    lines.append("-" * len(lines[0]))
+    for r in report["results"]:
+        # ref_ratio is per run, ops are the same for a case and its reference
+        vs = f"{r['ref_ratio']:.2f}x" if r["ref_ratio"] else ""
+        lines.append(f"{r['name']:<30}{r['size']:>8}{r['ns_per_op']:>14.1f}{r['peak_bytes'] / 1024:>12.1f}{vs:>12}")
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<30}{'size':>8}{'time':>10}{'noise':>8}{'memory':>10}  status"]
+    lines.append("-" * len(lines[0]))
+    for r in comparison["rows"]:
+        if r["regression"]:
+            status = "REGRESSION"
+        else:
+            status = "ok" if r["gated"] else "not gated"
+        if r["relative"]:
+            status += " (vs stdlib)"
+        ratios = f"{r['time_ratio']:>9.2f}x{r['noise']:>8.0%}{r['memory_ratio']:>9.2f}x"
+        lines.append(f"{r['name']:<30}{r['size']:>8}{ratios}  {status}")
+    for name, size in comparison["missing"]:
+        lines.append(f"{name:<30}{size:>8}{'':>28}  MISSING from current")
+    for name, size in comparison["extra"]:
+        lines.append(f"{name:<30}{size:>8}{'':>28}  not in baseline")
+    return "\n".join(lines)
+
+
+# endregion
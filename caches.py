@@ -0,0 +1,398 @@
+"""
+
+What is a cache?
+
+    A cache is a bounded key -> value store that keeps recently or frequently
+    used results around so they don't have to be recomputed or re-fetched.
+    Once the cache is full, an eviction policy decides which entry to drop.
+
+    Two common eviction policies:
+        * LRU (Least Recently Used): drop the entry that was touched the longest time ago
+        * LFU (Least Frequently Used): drop the entry that has been touched the least,
+          breaking ties by recency
+
+    Both are built by pairing a hash table with a doubly linked list. The hash
+    table maps a key straight to its node in the list, so the node can be unlinked
+    or moved to the front without traversing the list.
+
+        LRU:    dict[key] -> node in one list ordered from most to least recently used
+
+        LFU:    dict[key] -> node in one list per frequency ("bucket"). The buckets
+                are themselves kept in a list ordered by frequency, so the next
+                bucket is one pointer away and the eviction bucket is the head
+
+    Caches can be bounded by the number of entries (capacity), by the total
+    weight of the entries (max_weight, e.g. bytes) or both. Entries can also be
+    given a time to live (ttl) after which they are treated as missing.
+
+Complexity Analysis:
+
+                LRU     LFU
+    ------------------------
+    Get         O(1)    O(1)
+    Put         O(1)    O(1)
+    Evict       O(1)    O(1)
+    Delete      O(1)    O(1)
+
+"""
+import time
+from abc import ABC, abstractmethod
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from lists import DoublyLinkedList, Node
+
+
+class _Entry:
+    """
+    Payload stored in each list node. Holds the key so the hash table can be
+    cleaned up when the node is evicted from the tail of a list.
+    """
+
+    __slots__ = ("key", "value", "weight", "expires_at", "freq", "bucket")
+
+    def __init__(self, key: Hashable, value: Any, weight: float, expires_at: Optional[float]):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires_at = expires_at
+        self.freq = 1
+        # node of the frequency bucket holding this entry, only used by LFUCache
+        self.bucket: Optional[Node] = None
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+
+class _Cache(ABC):
+    """
+    Shared bookkeeping for the caches: bounds, weights, ttl and stats.
+    Subclasses provide the eviction policy.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = 128,
+        max_weight: Optional[float] = None,
+        weigher: Optional[Callable[[Hashable, Any], float]] = None,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("max_weight must be positive")
+        self._check_ttl(ttl)
+
+        self._capacity = capacity
+        self._max_weight = max_weight
+        self._weigher = weigher
+        self._ttl = ttl
+        self._timer = timer
+
+        # key -> node holding an _Entry
+        self._map: Dict[Hashable, Node] = {}
+        self._weight = 0
+        self._init_storage()
+
+        # stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # region magic methods
+    def __len__(self):
+        # note: expired entries are removed lazily so they count until touched
+        return len(self._map)
+
+    def __contains__(self, key: Hashable) -> bool:
+        node = self._map.get(key)
+        if node is None:
+            return False
+        if self._is_expired(node.data):
+            self._delete_node(node)
+            return False
+        return True
+
+    # endregion
+
+    # region public api
+    @property
+    def weight(self) -> float:
+        return self._weight
+
+    def is_empty(self) -> bool:
+        return len(self._map) == 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        if self._is_expired(node.data):
+            self._delete_node(node)
+            self.misses += 1
+            return default
+
+        self._touch(node)
+        self.hits += 1
+        return node.data.value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        weight = self._weigher(key, value) if self._weigher is not None else 1
+        if weight <= 0:
+            raise ValueError(f"Weight {weight} of key {key} must be positive")
+        if self._max_weight is not None and weight > self._max_weight:
+            raise ValueError(f"Weight {weight} of key {key} exceeds max_weight {self._max_weight}")
+
+        self._check_ttl(ttl)
+        ttl = ttl if ttl is not None else self._ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+
+        node = self._map.get(key)
+        if node is not None:
+            # update in place - rewriting a key counts as a use of it
+            entry = node.data
+            self._weight += weight - entry.weight
+            entry.value, entry.weight, entry.expires_at = value, weight, expires_at
+            self._touch(node)
+            self._evict(0, 0, keep=node)
+            return
+
+        # make room before linking the entry in so it can never be its own victim
+        self._evict(1, weight)
+        self._map[key] = self._insert(_Entry(key, value, weight, expires_at))
+        self._weight += weight
+
+    def delete(self, key: Hashable) -> bool:
+        node = self._map.get(key)
+        if node is None:
+            return False
+        self._delete_node(node)
+        return True
+
+    def clear(self):
+        self._map = {}
+        self._weight = 0
+        self._init_storage()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+    # endregion
+
+    # region helpers
+    @staticmethod
+    def _check_ttl(ttl: Optional[float]):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+    def _is_expired(self, entry: _Entry) -> bool:
+        return entry.expires_at is not None and self._timer() >= entry.expires_at
+
+    def _over_bounds(self, incoming: int, incoming_weight: float) -> bool:
+        # would adding `incoming` entries of the given total weight break a bound?
+        if self._capacity is not None and len(self._map) + incoming > self._capacity:
+            return True
+        return self._max_weight is not None and self._weight + incoming_weight > self._max_weight
+
+    def _evict(self, incoming: int, incoming_weight: float, keep: Optional[Node] = None):
+        while self._map and self._over_bounds(incoming, incoming_weight):
+            self._delete_node(self._victim(keep))
+            self.evictions += 1
+
+    def _delete_node(self, node: Node):
+        entry = node.data
+        del self._map[entry.key]
+        self._weight -= entry.weight
+        self._unlink(node)
+
+    # endregion
+
+    # region policy hooks
+    @abstractmethod
+    def _init_storage(self):
+        pass
+
+    @abstractmethod
+    def _insert(self, entry: _Entry) -> Node:
+        pass
+
+    @abstractmethod
+    def _touch(self, node: Node):
+        pass
+
+    @abstractmethod
+    def _unlink(self, node: Node):
+        pass
+
+    @abstractmethod
+    def _victim(self, keep: Optional[Node] = None) -> Node:
+        # the next entry to evict, never `keep` while other entries remain
+        pass
+
+    # endregion
+
+
+class LRUCache(_Cache):
+    """
+    Least Recently Used cache. The list is ordered from most recently used (head)
+    to least recently used (tail) and eviction takes from the tail.
+    """
+
+    def __str__(self):
+        return str(self._order)
+
+    def _init_storage(self):
+        self._order = DoublyLinkedList()
+
+    def _insert(self, entry: _Entry) -> Node:
+        return self._order._prepend_node(Node(entry, prev=None, next=None))
+
+    def _touch(self, node: Node):
+        self._order._move_to_front(node)
+
+    def _unlink(self, node: Node):
+        self._order._remove_node(node)
+
+    def _victim(self, keep: Optional[Node] = None) -> Node:
+        victim = self._order._tail
+        return victim.prev if victim is keep else victim
+
+
+class _Bucket:
+    """
+    All the LFU entries used exactly `freq` times, most recently used first.
+    """
+
+    __slots__ = ("freq", "entries")
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.entries = DoublyLinkedList()
+
+    def __str__(self):
+        return f"{self.freq}: {self.entries}"
+
+
+class LFUCache(_Cache):
+    """
+    Least Frequently Used cache. Entries live in one list per use count; within a
+    bucket the list is ordered by recency so ties are broken LRU style. The buckets
+    are linked in order of frequency so moving an entry up one use and finding the
+    least used bucket are both O(1).
+    """
+
+    def __str__(self):
+        out = []
+        trav = self._buckets._head
+        while trav is not None:
+            out.append(str(trav.data))
+            trav = trav.next
+        return "{" + ", ".join(out) + "}"
+
+    def _init_storage(self):
+        # list of _Bucket ordered from lowest (head) to highest frequency
+        self._buckets = DoublyLinkedList()
+
+    def _insert(self, entry: _Entry) -> Node:
+        # a new entry always has the lowest possible frequency
+        head = self._buckets._head
+        if head is None or head.data.freq != entry.freq:
+            head = self._buckets._prepend_node(Node(_Bucket(entry.freq), prev=None, next=None))
+        entry.bucket = head
+        return head.data.entries._prepend_node(Node(entry, prev=None, next=None))
+
+    def _touch(self, node: Node):
+        entry = node.data
+        bucket = entry.bucket
+        # link in the next bucket first so it survives the old one being removed
+        next_bucket = bucket.next
+        if next_bucket is None or next_bucket.data.freq != entry.freq + 1:
+            next_bucket = self._buckets._insert_after(bucket, _Bucket(entry.freq + 1))
+        self._unlink(node)
+        entry.freq += 1
+        entry.bucket = next_bucket
+        next_bucket.data.entries._prepend_node(node)
+
+    def _unlink(self, node: Node):
+        bucket = node.data.bucket
+        bucket.data.entries._remove_node(node)
+        if bucket.data.entries.is_empty():
+            self._buckets._remove_node(bucket)
+
+    def _victim(self, keep: Optional[Node] = None) -> Node:
+        bucket = self._buckets._head
+        victim = bucket.data.entries._tail
+        if victim is keep:
+            # keep was the only entry in the lowest bucket so take from the next one
+            victim = victim.prev or bucket.next.data.entries._tail
+        return victim
+
+
+def memoize(cache: Optional[_Cache] = None) -> Callable:
+    """
+    Decorator caching a function's results keyed on its arguments. Arguments must be
+    hashable. The cache used is exposed on the wrapped function as `.cache`.
+    Can be applied bare (@memoize) to use a default LRUCache.
+    """
+    if callable(cache) and not isinstance(cache, _Cache):
+        # used as @memoize without parentheses so the function was passed in
+        return memoize()(cache)
+    if cache is None:
+        cache = LRUCache()
+    elif not isinstance(cache, _Cache):
+        raise TypeError(f"memoize expects a cache, got {type(cache).__name__}")
+    # sentinel so None results are cached too
+    missing = object()
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # always keep args and kwargs apart so f(1, a=2) and f((1,), (("a", 2),)) differ
+            key = (args, tuple(sorted(kwargs.items())))
+            result = cache.get(key, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    lru = LRUCache(capacity=3)
+    for i in range(3):
+        lru.put(i, chr(ord("a") + i))
+    print(lru)
+
+    # touching 0 makes 1 the least recently used
+    lru.get(0)
+    lru.put(3, "d")
+    print(lru, lru.stats())
+
+    lfu = LFUCache(capacity=3)
+    for i in range(3):
+        lfu.put(i, i * i)
+    lfu.get(0)
+    lfu.get(0)
+    lfu.get(2)
+    # 1 has the lowest frequency so it gets evicted
+    lfu.put(3, 9)
+    print(lfu, lfu.stats())
+
+    weighted = LRUCache(capacity=None, max_weight=10, weigher=lambda k, v: len(v))
+    weighted.put("a", "hello")
+    weighted.put("b", "world")
+    weighted.put("c", "!!")
+    print(weighted, f"Weight: {weighted.weight}")
+
+    @memoize(LRUCache(capacity=64))
+    def fib(n: int) -> int:
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(50), fib.cache.stats())
@@ -0,0 +1,323 @@
+"""
+
+What is instrumentation?
+
+    Counting the work a data structure does (comparisons, swaps, copies, nodes
+    traversed) and how long its operations take, so slow behaviour can be traced
+    back to its cause rather than guessed at.
+
+    Instrumentation here is opt-in. Calling enable() swaps wrapped versions of the
+    relevant methods onto the classes and disable() puts the originals back, so
+    when it is off the structures run exactly the code they always did.
+
+    Counters are global across all instances and are exported as a flat dict:
+
+        PriorityQueue.swaps                 every call to _swap
+        PriorityQueue.sink_steps            swaps made while sinking
+        PriorityQueue.swim_steps            swaps made while swimming
+        PriorityQueue.comparisons           ordering comparisons made by _sink/_swim
+        DynamicArray.resizes                capacity doublings in add
+        DynamicArray.copied_elements        elements copied by resizes and remove_at
+        DoublyLinkedList.<op>.traversal     histogram of nodes walked by remove/insert_at
+
+    With timing=True every public operation also records a latency histogram in
+    nanoseconds, keyed as "<Class>.<op>.latency_ns".
+
+    Note: the wrapped methods keep counters in module state so this is not thread safe.
+"""
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple
+
+from arrays import DynamicArray
+from lists import DoublyLinkedList
+from priority_queues import PriorityQueue
+from queues import Queue
+from stacks import Stack
+
+
+class Histogram:
+    """
+    Histogram with power of two buckets. Bucket k counts values in [2^(k-1), 2^k),
+    with bucket 0 holding values below 1.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value: float):
+        bucket = int(value).bit_length() if value >= 1 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean(),
+            # keyed by the exclusive upper bound of each bucket
+            "buckets": {str(1 << k): n for k, n in sorted(self.buckets.items())},
+        }
+
+
+# methods to time when timing is enabled
+TIMED: List[Tuple[type, str]] = [
+    (DynamicArray, "add"),
+    (DynamicArray, "remove_at"),
+    (DynamicArray, "remove"),
+    (DoublyLinkedList, "append"),
+    (DoublyLinkedList, "prepend"),
+    (DoublyLinkedList, "remove_first"),
+    (DoublyLinkedList, "remove_last"),
+    (DoublyLinkedList, "remove"),
+    (DoublyLinkedList, "insert_at"),
+    (Stack, "push"),
+    (Stack, "pop"),
+    (Queue, "enqueue"),
+    (Queue, "dequeue"),
+    (PriorityQueue, "add"),
+    (PriorityQueue, "poll"),
+    (PriorityQueue, "remove"),
+]
+
+_counters: Dict[str, int] = {}
+_histograms: Dict[str, Histogram] = {}
+# original methods, keyed by (class, name), while instrumentation is enabled
+_originals: Dict[Tuple[type, str], Callable] = {}
+# index paths of the _sink/_swim calls in progress - _swap appends to the innermost
+_paths: List[List[int]] = []
+
+
+# region recording
+def _count(name: str, amount: int = 1):
+    _counters[name] = _counters.get(name, 0) + amount
+
+
+def _histogram(name: str) -> Histogram:
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    return histogram
+
+
+# endregion
+
+# region wrappers
+def _arg(args: tuple, kwargs: Dict[str, Any], position: int, name: str) -> Any:
+    # wrappers forward whatever they were called with, so read an argument
+    # whether it was passed positionally or by keyword
+    return args[position] if len(args) > position else kwargs[name]
+
+
+def _swap(original: Callable) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        _count("PriorityQueue.swaps")
+        # both _sink and _swim pass the index being moved to as index_a
+        if _paths:
+            _paths[-1].append(_arg(args, kwargs, 0, "index_a"))
+        return original(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _swim(original: Callable) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        _paths.append([_arg(args, kwargs, 0, "index")])
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            path = _paths.pop()
+            steps = len(path) - 1
+            _count("PriorityQueue.swim_steps", steps)
+            # one comparison per swap, plus the failed one that stopped the loop
+            # unless it stopped because it reached the root
+            _count("PriorityQueue.comparisons", steps + (1 if path[-1] > 0 else 0))
+
+    return wrapper
+
+
+def _sink(original: Callable) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        _paths.append([_arg(args, kwargs, 0, "index")])
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            path = _paths.pop()
+            size = self.heap_size
+            _count("PriorityQueue.sink_steps", len(path) - 1)
+            # each visited index compares its children (if it has a right child)
+            # and then itself against the smaller child (if it has a left child)
+            _count("PriorityQueue.comparisons", sum((2 * i + 2 < size) + (2 * i + 1 < size) for i in path))
+
+    return wrapper
+
+
+def _array_add(original: Callable) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        capacity = self._DynamicArray__capacity
+        result = original(self, *args, **kwargs)
+        if self._DynamicArray__capacity != capacity:
+            _count("DynamicArray.resizes")
+            # every slot of the old backing array is copied over
+            _count("DynamicArray.copied_elements", capacity)
+        return result
+
+    return wrapper
+
+
+def _array_remove_at(original: Callable) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        # the backing array is rebuilt without the removed slot
+        _count("DynamicArray.copied_elements", self._DynamicArray__capacity - 1)
+        return result
+
+    return wrapper
+
+
+def _list_traversal(op: str, offset: int) -> Callable[[Callable], Callable]:
+    # remove walks idx nodes to reach the target, insert_at walks idx - 1 to reach
+    # the node before it; both skip the walk at either end of the list
+    def decorator(original: Callable) -> Callable:
+        @wraps(original)
+        def wrapper(self, *args, **kwargs):
+            idx = _arg(args, kwargs, 0, "idx")
+            end = idx == 0 or idx == len(self) - 1
+            result = original(self, *args, **kwargs)
+            _histogram(f"DoublyLinkedList.{op}.traversal").record(0 if end else idx - offset)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _timed(name: str) -> Callable[[Callable], Callable]:
+    name = f"{name}.latency_ns"
+
+    def decorator(original: Callable) -> Callable:
+        @wraps(original)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                _histogram(name).record(time.perf_counter_ns() - start)
+
+        return wrapper
+
+    return decorator
+
+
+# endregion
+
+COUNTED: List[Tuple[type, str, Callable[[Callable], Callable]]] = [
+    (PriorityQueue, "_swap", _swap),
+    (PriorityQueue, "_swim", _swim),
+    (PriorityQueue, "_sink", _sink),
+    (DynamicArray, "add", _array_add),
+    (DynamicArray, "remove_at", _array_remove_at),
+    (DoublyLinkedList, "remove", _list_traversal("remove", 0)),
+    (DoublyLinkedList, "insert_at", _list_traversal("insert_at", 1)),
+]
+
+
+# region public api
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable(timing: bool = False):
+    if is_enabled():
+        raise RuntimeError("Instrumentation is already enabled")
+
+    wrappers: Dict[Tuple[type, str], List[Callable]] = {}
+    for cls, name, wrap in COUNTED:
+        wrappers.setdefault((cls, name), []).append(wrap)
+    if timing:
+        for cls, name in TIMED:
+            wrappers.setdefault((cls, name), []).append(_timed(f"{cls.__name__}.{name}"))
+
+    for (cls, name), wraps_ in wrappers.items():
+        original = cls.__dict__[name]
+        _originals[(cls, name)] = original
+        method = original
+        for wrap in wraps_:
+            method = wrap(method)
+        setattr(cls, name, method)
+
+
+def disable():
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+    _paths.clear()
+
+
+def reset():
+    _counters.clear()
+    _histograms.clear()
+
+
+def counters() -> Dict[str, Any]:
+    out: Dict[str, Any] = dict(sorted(_counters.items()))
+    for name, histogram in sorted(_histograms.items()):
+        out[name] = histogram.to_dict()
+    return out
+
+
+@contextmanager
+def instrumented(timing: bool = False):
+    enable(timing=timing)
+    try:
+        yield
+    finally:
+        disable()
+
+
+# endregion
+
+
+if __name__ == "__main__":
+    import json
+    import random
+
+    with instrumented(timing=True):
+        pq = PriorityQueue()
+        values = list(range(100))
+        random.shuffle(values)
+        for v in values:
+            pq.add(v)
+        for _ in range(50):
+            pq.poll()
+
+        arr = DynamicArray()
+        for i in range(100):
+            arr.add(i)
+        arr.remove_at(10)
+
+        dll = DoublyLinkedList()
+        for i in range(100):
+            dll.append(i)
+        dll.remove(40)
+        dll.insert_at(60, "x")
+
+    print(json.dumps(counters(), indent=2))
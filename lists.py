@@ -96,12 +96,7 @@ class DoublyLinkedList:
         self._size = 0
 
     def prepend(self, data: Any):
-        if self.is_empty():
-            self._head = self._tail = Node(data=data, prev=None, next=None)
-        else:
-            self._head.prev = Node(data=data, prev=None, next=self._head)
-            self._head = self._head.prev
-        self._size += 1
+        self._prepend_node(Node(data=data, prev=None, next=None))
 
     def append(self, data: Any):
         if self.is_empty():
@@ -168,6 +163,48 @@ class DoublyLinkedList:
 
         return data
 
+    def _prepend_node(self, n: "Node") -> "Node":
+        # link an existing node in at the head - callers holding a reference
+        # to the node can later unlink or move it in O(1)
+        n.prev = None
+        n.next = self._head
+        if self.is_empty():
+            self._tail = n
+        else:
+            self._head.prev = n
+        self._head = n
+        self._size += 1
+        return n
+
+    def _insert_after(self, n: "Node", data: Any) -> "Node":
+        # link a new node in straight after an existing one without traversing
+        new_node = Node(data, prev=n, next=n.next)
+        if n.next is None:
+            self._tail = new_node
+        else:
+            n.next.prev = new_node
+        n.next = new_node
+        self._size += 1
+        return new_node
+
+    def _move_to_front(self, n: "Node"):
+        # already at the head so nothing to do
+        if n.prev is None:
+            return
+
+        # unlink the node from its current position
+        n.prev.next = n.next
+        if n.next is None:
+            self._tail = n.prev
+        else:
+            n.next.prev = n.prev
+
+        # relink at the head
+        n.prev = None
+        n.next = self._head
+        self._head.prev = n
+        self._head = n
+
     def remove(self, idx: int) -> Any:
         assert 0 <= idx < self._size, "OutOfBoundsError"
         # check head and tail removal
@@ -165,6 +165,10 @@ class PriorityQueue:
             # update the hash map - i.e. remove the index where the item was held
             self._hash[item].pop()
 
+            # the removed item was the last in the heap so nothing moved into its place
+            if index == self.heap_size:
+                return item
+
             # get the new element at index
             elem = self._heap[index]
 
@@ -202,3 +206,8 @@ if __name__ == "__main__":
 
     for i in range(pq.heap_size):
         print(pq.poll())
+
+    # removing the value held in the last slot of the heap
+    for value in [3, 1, 2]:
+        pq.add(value)
+    print(f"Removed: {pq.remove(2)}, remaining: {[pq.poll() for _ in range(pq.heap_size)]}")